@@ -15,3 +15,14 @@ class CheckpointStoreAdapter(CheckpointStore):
     def save_checkpoints(self, hashes: dict[Path, str]):
         with open(self._store_location, "w") as f:
             json.dump({str(k): v for k, v in hashes.items()}, f)
+
+
+def make_sample_store(store_path: Path) -> CheckpointStoreAdapter:
+    """
+    Sample digests for the quick check live next to the main checkpoints store (store.json -> store.samples.json).
+    """
+    return CheckpointStoreAdapter(sample_store_path(store_path))
+
+
+def sample_store_path(store_path: Path) -> Path:
+    return Path(store_path).with_suffix(".samples.json")
@@ -2,7 +2,7 @@ import pytest
 
 from pathlib import Path
 
-from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter
+from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter, make_sample_store
 
 
 def test_load_checkpoints_should_load_path_to_hash_mapping_from_json_file():
@@ -38,3 +38,10 @@ def test_load_checkpoints_should_read_what_save_checkpoints_saved(tmp_path):
     store.save_checkpoints(hashes)
     loaded = store.load_checkpoints()
     assert loaded == hashes
+
+
+def test_make_sample_store_should_keep_samples_next_to_main_store(tmp_path):
+    store_location = tmp_path / "test_store.json"
+    hashes = {Path("dirwatcher/checkpoint_store.py"): "7386:f00d"}
+    make_sample_store(store_location).save_checkpoints(hashes)
+    assert CheckpointStoreAdapter(tmp_path / "test_store.samples.json").load_checkpoints() == hashes
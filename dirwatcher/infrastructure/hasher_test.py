@@ -0,0 +1,60 @@
+import pytest
+
+from pathlib import Path
+
+from dirwatcher.infrastructure.hasher import SamplingHasher
+
+
+def test_sampling_hasher_should_raise_FileNotFoundError_when_file_not_found():
+    with pytest.raises(FileNotFoundError):
+        SamplingHasher().hash_content(Path("some/non-existent-file.txt"))
+
+
+def test_sampling_hasher_should_give_same_digest_for_same_content(tmp_path):
+    test_path = tmp_path / "file.bin"
+    test_path.write_bytes(bytes(range(256)) * 1024)
+    assert SamplingHasher().hash_content(test_path) == SamplingHasher().hash_content(test_path)
+
+
+def test_sampling_hasher_should_notice_changed_size(tmp_path):
+    test_path = tmp_path / "file.bin"
+    test_path.write_bytes(b"a" * 100_000)
+    before = SamplingHasher().hash_content(test_path)
+    test_path.write_bytes(b"a" * 100_001)
+    assert SamplingHasher().hash_content(test_path) != before
+
+
+def test_sampling_hasher_should_notice_changed_tail(tmp_path):
+    test_path = tmp_path / "file.bin"
+    test_path.write_bytes(b"a" * 100_000)
+    before = SamplingHasher().hash_content(test_path)
+    test_path.write_bytes(b"a" * 99_999 + b"b")
+    assert SamplingHasher().hash_content(test_path) != before
+
+
+def test_sampling_hasher_should_cover_whole_content_of_small_files(tmp_path):
+    test_path = tmp_path / "file.bin"
+    test_path.write_bytes(b"a" * 10_000)
+    before = SamplingHasher().hash_content(test_path)
+    test_path.write_bytes(b"a" * 5_000 + b"b" + b"a" * 4_999)
+    assert SamplingHasher().hash_content(test_path) != before
+
+
+def test_sampling_hasher_should_sample_at_fixed_offsets_for_given_size():
+    assert SamplingHasher()._sample_offsets(100_000) == [0, 27048, 50000, 72952, 95904]
+
+
+def test_sampling_hasher_should_keep_digest_format_stable(tmp_path):
+    test_path = tmp_path / "file.bin"
+    test_path.write_bytes(bytes(range(256)) * 400)
+    assert SamplingHasher().hash_content(test_path) == \
+        "102400:a4759e7aa20338328866a2ea17eaf8c7fe4ec6bbe3bb71cee7df7c0461b3c22f"
+
+
+def test_sampling_hasher_should_report_whole_content_coverage_only_for_small_files(tmp_path):
+    small_path, big_path = tmp_path / "small.bin", tmp_path / "big.bin"
+    small_path.write_bytes(b"a" * 20_480)
+    big_path.write_bytes(b"a" * 20_481)
+    hasher = SamplingHasher()
+    assert hasher.covers_whole_content(hasher.hash_content(small_path))
+    assert not hasher.covers_whole_content(hasher.hash_content(big_path))
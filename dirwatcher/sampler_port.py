@@ -0,0 +1,10 @@
+from pathlib import Path
+from typing import Protocol
+
+
+class Sampler(Protocol):
+    def hash_content(self, path: Path) -> str:
+        ...
+
+    def covers_whole_content(self, digest: str) -> bool:
+        ...
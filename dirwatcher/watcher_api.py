@@ -2,20 +2,27 @@ from pathlib import Path
 import logging
 from flask import Flask, request
 
-from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter
-from dirwatcher.infrastructure.hasher import Hasher
+from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter, make_sample_store
+from dirwatcher.infrastructure.hasher import Hasher, SamplingHasher
 from dirwatcher.infrastructure.traverser import make_traverser
 from dirwatcher.watcher_service import WatcherService, NoPriorCheckpointSavedError, InvalidDirectoryRequested
 
 app = Flask("dirwatcher")
 logger = logging.getLogger(__name__)
 STORE_LOCATION = "store.json"
+FLAG_VALUES = {"true": True, "1": True, "yes": True, "on": True, "false": False, "0": False, "no": False, "off": False}
 
 
 @app.route("/save", methods=["POST"])
 def save_current_state():
     directory = request.json["toWatch"]
-    service = WatcherService(make_traverser(Path(directory)), CheckpointStoreAdapter(), Hasher())
+    service = WatcherService(
+        make_traverser(Path(directory)),
+        CheckpointStoreAdapter(Path(STORE_LOCATION)),
+        Hasher(),
+        SamplingHasher(),
+        make_sample_store(Path(STORE_LOCATION))
+    )
     try:
         service.checkpoint_current_state()
     except InvalidDirectoryRequested as e:
@@ -27,8 +34,20 @@ def save_current_state():
 @app.route("/ischanged")
 def has_anything_changed():
     directory = request.args["toWatch"]
-    service = WatcherService(make_traverser(Path(directory)), CheckpointStoreAdapter(Path(STORE_LOCATION)), Hasher())
+    quick = FLAG_VALUES.get(request.args.get("quick", "false").lower())
+    if quick is None:
+        return {"error": "quick must be one of: " + ", ".join(FLAG_VALUES)}, 400
+    service = WatcherService(
+        make_traverser(Path(directory)),
+        CheckpointStoreAdapter(Path(STORE_LOCATION)),
+        Hasher(),
+        SamplingHasher(),
+        make_sample_store(Path(STORE_LOCATION))
+    )
     try:
+        if quick:
+            changed, confidence = service.quick_check()
+            return {"changed": changed, "confidence": confidence.value}, 200
         return {"changed": service.has_anything_changed()}, 200
     except NoPriorCheckpointSavedError as e:
         logger.error(e)
@@ -11,6 +11,7 @@ def client():
     with watcher_api.app.test_client() as client:
         yield client
     Path(watcher_api.STORE_LOCATION).unlink(missing_ok=True)
+    Path(watcher_api.STORE_LOCATION).with_suffix(".samples.json").unlink(missing_ok=True)
 
 
 def test_save_current_state_saves_current_checkpoints_and_returns_200_if_directory_exist(client):
@@ -34,4 +35,44 @@ def test_has_anything_changed_returns_json_with_information_if_previous_checkpoi
 def test_has_anything_changed_returns_json_with_info_about_error_if_no_prior_checkpoint_found(client):
     result = client.get("/ischanged?toWatch=dirwatcher/infrastructure/")
     assert result.status_code == 400
-    assert result.get_json() == {"error": "you tried to use this endpoint without previously saving state"}
\ No newline at end of file
+    assert result.get_json() == {"error": "you tried to use this endpoint without previously saving state"}
+
+
+def test_has_anything_changed_in_quick_mode_returns_json_with_change_and_confidence(client, tmp_path):
+    (tmp_path / "small.txt").write_text("Hello darkness my old friend")
+    result = client.post("/save", json={"toWatch": str(tmp_path)})
+    assert result.status_code == 200
+    result = client.get(f"/ischanged?toWatch={tmp_path}&quick=true")
+    assert result.status_code == 200
+    assert result.get_json() == {"changed": False, "confidence": "certain"}
+
+
+def test_has_anything_changed_in_quick_mode_is_not_certain_if_big_files_were_only_sampled(client, tmp_path):
+    (tmp_path / "big.bin").write_bytes(b"a" * 100_000)
+    result = client.post("/save", json={"toWatch": str(tmp_path)})
+    assert result.status_code == 200
+    result = client.get(f"/ischanged?toWatch={tmp_path}&quick=true")
+    assert result.status_code == 200
+    assert result.get_json() == {"changed": False, "confidence": "probable"}
+
+
+def test_has_anything_changed_in_quick_mode_returns_400_if_no_prior_checkpoint_found(client):
+    result = client.get("/ischanged?toWatch=dirwatcher&quick=true")
+    assert result.status_code == 400
+    assert result.get_json() == {"error": "you tried to use this endpoint without previously saving state"}
+
+
+@pytest.mark.parametrize("quick", ["1", "yes", "On", "TRUE"])
+def test_has_anything_changed_accepts_usual_true_values_for_quick_mode(client, tmp_path, quick):
+    (tmp_path / "small.txt").write_text("Hello darkness my old friend")
+    result = client.post("/save", json={"toWatch": str(tmp_path)})
+    assert result.status_code == 200
+    result = client.get(f"/ischanged?toWatch={tmp_path}&quick={quick}")
+    assert result.status_code == 200
+    assert result.get_json() == {"changed": False, "confidence": "certain"}
+
+
+def test_has_anything_changed_returns_400_for_unknown_quick_value(client):
+    result = client.get("/ischanged?toWatch=dirwatcher&quick=maybe")
+    assert result.status_code == 400
+    assert result.get_json() == {"error": "quick must be one of: true, 1, yes, on, false, 0, no, off"}
@@ -1,10 +1,10 @@
 import click
 from pathlib import Path
 
-from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter
-from dirwatcher.infrastructure.hasher import Hasher
+from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter, make_sample_store, sample_store_path
+from dirwatcher.infrastructure.hasher import Hasher, SamplingHasher
 from dirwatcher.infrastructure.traverser import make_traverser
-from dirwatcher.watcher_service import WatcherService, NoPriorCheckpointSavedError, Change
+from dirwatcher.watcher_service import WatcherService, NoPriorCheckpointSavedError, InvalidDirectoryRequested, Change
 
 
 @click.group()
@@ -33,17 +33,23 @@ def watch(ctx: click.Context):
     Start monitoring particular directory
     """
     store, path = ctx.obj["store"], ctx.obj["path"]
-    if store.exists():
+    samples = sample_store_path(store)
+    if store.exists() or samples.exists():
         exit(click.echo("Checkpoints store already exists - choose another location."))
 
     watcher_service = WatcherService(
         make_traverser(path),
         CheckpointStoreAdapter(store_path=store),
-        Hasher()
+        Hasher(),
+        SamplingHasher(),
+        make_sample_store(store)
     )
     try:
         watcher_service.checkpoint_current_state()
-    except FileNotFoundError as e:
+    except (InvalidDirectoryRequested, OSError) as e:
+        # neither file existed before, so drop whichever got written - a half-saved pair would block the next watch
+        store.unlink(missing_ok=True)
+        samples.unlink(missing_ok=True)
         exit(click.echo(f"Could not checkpoint current state due to: {e}"))
 
 
@@ -6,6 +6,8 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
+from dirwatcher import watcher_cli
+from dirwatcher.infrastructure.checkpoint_store import CheckpointStoreAdapter
 from dirwatcher.watcher_cli import cli
 
 
@@ -46,6 +48,42 @@ def test_cli_should_accept_a_store_location_as_an_option(tmpdir_with_file):
         assert store_contains_expected_content(store_path, test_path)
 
 
+def test_cli_watch_should_save_sample_digests_next_to_the_store(tmpdir_with_file):
+    tmpdir, test_path, store_path = tmpdir_with_file
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmpdir):
+        result = runner.invoke(cli, ["--store", str(store_path), str(tmpdir), "watch"])
+        assert result.exit_code == 0
+        with open(tmpdir / "store.samples.json") as f:
+            assert list(json.load(f)) == [str(test_path)]
+
+
+def test_cli_watch_should_not_overwrite_existing_sample_digests(tmpdir_with_file):
+    tmpdir, test_path, store_path = tmpdir_with_file
+    samples_path = tmpdir / "store.samples.json"
+    with open(samples_path, "w") as f:
+        f.write("precious")
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmpdir):
+        result = runner.invoke(cli, ["--store", str(store_path), str(tmpdir), "watch"])
+        assert result.stdout == "Checkpoints store already exists - choose another location.\n"
+        assert not Path(store_path).exists()
+        with open(samples_path) as f:
+            assert f.read() == "precious"
+
+
+def test_cli_watch_should_not_leave_store_without_sample_digests_if_saving_fails(tmpdir_with_file, monkeypatch):
+    tmpdir, test_path, store_path = tmpdir_with_file
+    unwritable = Path(tmpdir / "unwritable")
+    unwritable.mkdir()
+    monkeypatch.setattr(watcher_cli, "make_sample_store", lambda store: CheckpointStoreAdapter(unwritable))
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmpdir):
+        result = runner.invoke(cli, ["--store", str(store_path), str(tmpdir), "watch"])
+        assert result.stdout.startswith("Could not checkpoint current state due to:")
+        assert not Path(store_path).exists()
+
+
 def test_cli_should_not_allow_dirs_as_store_paths(tmpdir):
     runner = CliRunner()
     with runner.isolated_filesystem(temp_dir=tmpdir):
@@ -1,9 +1,10 @@
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Callable, Iterator, Optional
 
 from dirwatcher.checkpoint_store_port import CheckpointStore
 from dirwatcher.hasher_port import Hasher
+from dirwatcher.sampler_port import Sampler
 
 
 class Change(Enum):
@@ -12,20 +13,38 @@ class Change(Enum):
     CONTENT_CHANGED = 3
 
 
+class Confidence(Enum):
+    CERTAIN = "certain"
+    PROBABLE = "probable"
+
+
 class NoPriorCheckpointSavedError(Exception):
     pass
 
 
+class QuickCheckNotConfiguredError(Exception):
+    pass
+
+
 class InvalidDirectoryRequested(Exception):
     pass
 
 
 class WatcherService:
 
-    def __init__(self, traverser: Callable[[], Iterator[Path]], store: CheckpointStore, hasher: Hasher):
+    def __init__(
+            self,
+            traverser: Callable[[], Iterator[Path]],
+            store: CheckpointStore,
+            hasher: Hasher,
+            sampler: Optional[Sampler] = None,
+            sample_store: Optional[CheckpointStore] = None
+    ):
         self._traverser = traverser
         self._store = store
         self._hasher = hasher
+        self._sampler = sampler
+        self._sample_store = sample_store
 
     def has_anything_changed(self) -> bool:
         """
@@ -47,15 +66,50 @@ class WatcherService:
             raise InvalidDirectoryRequested(e)
         return checkpoints != current_checkpoints
 
+    def quick_check(self) -> tuple[bool, Confidence]:
+        """
+        Estimates if any of the watched files has changed by comparing only the sample digests
+        (size and a few sampled byte ranges) of each file - the full hash is available via has_anything_changed.
+
+        :raises:
+        QuickCheckNotConfiguredError - when the service was created without sampler and sample_store
+        NoPriorCheckpointSavedError - when there's no previously saved sample checkpoint to check against
+        :return:
+        (True, Confidence.CERTAIN) - if there is a change
+        (False, Confidence.CERTAIN) - if there isn't and every file was small enough to be sampled whole
+        (False, Confidence.PROBABLE) - if none was found in the samples, changes outside of them can go unnoticed
+        """
+        if self._sampler is None or self._sample_store is None:
+            raise QuickCheckNotConfiguredError("Quick check requires both sampler and sample_store")
+        try:
+            samples = self._sample_store.load_checkpoints()
+        except FileNotFoundError as e:
+            raise NoPriorCheckpointSavedError(e) from e
+        try:
+            current_samples = self._sample_dir()
+        except FileNotFoundError as e:
+            raise InvalidDirectoryRequested(e)
+        if samples != current_samples:
+            return True, Confidence.CERTAIN
+        if all(self._sampler.covers_whole_content(digest) for digest in current_samples.values()):
+            return False, Confidence.CERTAIN
+        return False, Confidence.PROBABLE
+
     def checkpoint_current_state(self):
         """
         Calculates hashes of each of the watched files
-        and saves the mapping path->hash using checkpoint_store.save_checkpoints
+        and saves the mapping path->hash using checkpoint_store.save_checkpoints.
+        If the service has a sampler and sample_store, sample digests are saved as well for the quick_check
         :return:
         None
         """
+        quick_check_configured = self._sampler is not None and self._sample_store is not None
         try:
-            self._store.save_checkpoints(self._hash_dir())
+            checkpoints = self._hash_dir()
+            samples = self._sample_dir() if quick_check_configured else None
+            self._store.save_checkpoints(checkpoints)
+            if quick_check_configured:
+                self._sample_store.save_checkpoints(samples)
         except FileNotFoundError as e:
             raise InvalidDirectoryRequested(e)
 
@@ -93,3 +147,6 @@ class WatcherService:
 
     def _hash_dir(self) -> dict[Path, str]:
         return {item: self._hasher.hash_content(item) for item in self._traverser()}
+
+    def _sample_dir(self) -> dict[Path, str]:
+        return {item: self._sampler.hash_content(item) for item in self._traverser()}
@@ -3,7 +3,10 @@ from pathlib import Path
 import pytest
 
 from dirwatcher.checkpoint_store_port import CheckpointStore
-from dirwatcher.watcher_service import WatcherService, NoPriorCheckpointSavedError, Change
+from dirwatcher.watcher_service import (
+    WatcherService, NoPriorCheckpointSavedError, InvalidDirectoryRequested, Change, Confidence,
+    QuickCheckNotConfiguredError
+)
 
 
 class _FakeCheckpointStoreAdapter(CheckpointStore):
@@ -26,6 +29,15 @@ class _FakeCheckpointStoreAdapter(CheckpointStore):
         self._saved_hashes = hashes
 
 
+class _MissingCheckpointStoreAdapter(CheckpointStore):
+
+    def load_checkpoints(self) -> dict[Path, str]:
+        raise FileNotFoundError("No such file: store.samples.json")
+
+    def save_checkpoints(self, hashes: dict[Path, str]):
+        pass
+
+
 class _FakeHasher:
     def hash_content(self, path: Path) -> str:
         hashes = {
@@ -35,6 +47,14 @@ class _FakeHasher:
         return hashes[str(path)]
 
 
+class _FakeSampler(_FakeHasher):
+    def __init__(self, samples_whole_files=False):
+        self._samples_whole_files = samples_whole_files
+
+    def covers_whole_content(self, digest: str) -> bool:
+        return self._samples_whole_files
+
+
 @pytest.mark.parametrize("store_contents,expected_result", [
     ({
          Path("file1.txt"): "64496aedaadf981a8bd77f4ebb6e949eecaa15fb93cc3fa3fcb17acccd117e60",
@@ -142,3 +162,109 @@ def test_get_changes_since_last_checkpoint_should_notice_changed_files():
     assert result.get(Change.NEW) == []
     assert result.get(Change.DELETED) == []
     assert result.get(Change.CONTENT_CHANGED) == [Path("file2.txt")]
+
+
+def test_quick_check_should_report_certain_change_if_samples_differ():
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt"), Path("file2.txt")],
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher(),
+        _FakeSampler(),
+        _FakeCheckpointStoreAdapter({
+            Path("file1.txt"): "64496aedaadf981a8bd77f4ebb6e949eecaa15fb93cc3fa3fcb17acccd117e60",
+        })
+    )
+
+    assert service_under_test.quick_check() == (True, Confidence.CERTAIN)
+
+
+def test_quick_check_should_report_certain_change_if_sample_of_the_same_file_differs():
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt"), Path("file2.txt")],
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher(),
+        _FakeSampler(),
+        _FakeCheckpointStoreAdapter({
+            Path("file1.txt"): "64496aedaadf981a8bd77f4ebb6e949eecaa15fb93cc3fa3fcb17acccd117e60",
+            Path("file2.txt"): "7b4dbecac0c118e9d79fd47832430bc80309866805c5517f97b3352218e8a0c4",
+        })
+    )
+
+    assert service_under_test.quick_check() == (True, Confidence.CERTAIN)
+
+
+def test_quick_check_should_raise_if_no_prior_sample_checkpoint_found():
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt"), Path("file2.txt")],
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher(),
+        _FakeSampler(),
+        _MissingCheckpointStoreAdapter()
+    )
+    with pytest.raises(NoPriorCheckpointSavedError):
+        service_under_test.quick_check()
+
+
+def test_quick_check_should_raise_if_watched_directory_does_not_exist():
+    def missing_directory():
+        raise FileNotFoundError("no such directory")
+
+    service_under_test = WatcherService(
+        missing_directory,
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher(),
+        _FakeSampler(),
+        _FakeCheckpointStoreAdapter({})
+    )
+    with pytest.raises(InvalidDirectoryRequested):
+        service_under_test.quick_check()
+
+
+def test_quick_check_should_report_certainly_unchanged_if_samples_match_and_cover_whole_files():
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt"), Path("file2.txt")],
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher(),
+        _FakeSampler(samples_whole_files=True),
+        _FakeCheckpointStoreAdapter({
+            Path("file1.txt"): "64496aedaadf981a8bd77f4ebb6e949eecaa15fb93cc3fa3fcb17acccd117e60",
+            Path("file2.txt"): "bf470f3fe05eef6ba064ed3f9859aeddfeece239f9234f35448c95e943015b52",
+        })
+    )
+
+    assert service_under_test.quick_check() == (False, Confidence.CERTAIN)
+
+
+def test_quick_check_should_report_probably_unchanged_if_samples_match():
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt"), Path("file2.txt")],
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher(),
+        _FakeSampler(),
+        _FakeCheckpointStoreAdapter({
+            Path("file1.txt"): "64496aedaadf981a8bd77f4ebb6e949eecaa15fb93cc3fa3fcb17acccd117e60",
+            Path("file2.txt"): "bf470f3fe05eef6ba064ed3f9859aeddfeece239f9234f35448c95e943015b52",
+        })
+    )
+
+    assert service_under_test.quick_check() == (False, Confidence.PROBABLE)
+
+
+def test_quick_check_should_raise_if_not_configured():
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt"), Path("file2.txt")],
+        _FakeCheckpointStoreAdapter({}),
+        _FakeHasher()
+    )
+    with pytest.raises(QuickCheckNotConfiguredError):
+        service_under_test.quick_check()
+
+
+def test_checkpoint_current_state_saves_samples_if_sampler_configured():
+    sample_store = _FakeCheckpointStoreAdapter({})
+    service_under_test = WatcherService(
+        lambda: [Path("file1.txt")], _FakeCheckpointStoreAdapter({}), _FakeHasher(), _FakeSampler(), sample_store)
+    service_under_test.checkpoint_current_state()
+    assert sample_store.saved_checkpoints == {
+        Path("file1.txt"): "64496aedaadf981a8bd77f4ebb6e949eecaa15fb93cc3fa3fcb17acccd117e60",
+    }